@@ -2,27 +2,68 @@
 Analysis agent for general alert processing.
 """
 
-import asyncio
-from typing import Any, Dict, List
+import os
+from typing import Any, Dict, Optional
 
 from strands import Agent
 
 from tools.mcp_client import AtlassianMCPClient, MCPToolManager
+from tools.analysis.event_identification import _classify_event
 from tools.analysis.tool_factory import create_analysis_tools
-from utilities.logger import get_logger, styled_log
-from utilities.strands_model import model
+from tools.analysis.troubleshooting_steps import _get_predefined_steps
+from utilities.logger import get_logger, styled_log, styled_stream
+from utilities.strands_model import get_model, run_agent
 
 logger = get_logger(__name__)
 
+_ANALYSIS_PROMPT = """
+You are the **Analysis Agent**, supporting the **Frontline Response Agent** by analyzing alarms and extracting critical details.
+
+## Goals
+1. Gather any useful information about the alarm message.
+2. Find the closest event in the documentation to the alarm message by searching through all available Confluence documentation.
+3. Provide a clear event ID and context for the Frontline Response Agent.
+
+## Process
+- Step 1: Use your tools to gain understanding on what's happening in the alarm message.
+- Step 2: Use getAccessibleAtlassianResources to discover available Confluence spaces and pages.
+- Step 3: Use searchContent to find relevant documentation pages related to the alarm. When you have several queries, pass them together to searchContents.
+- Step 4: Use getConfluencePage to retrieve detailed content from relevant pages. When several pages look relevant, fetch them together with getConfluencePages. When you have both pages to read and searches to run, do them together with fetchConfluenceContent.
+- Step 5: Match the event ID in the documentation to the alarm message. Note that the event ID is almost never mentioned in the alarm message.
+- Step 6: Provide frontline response instructions for the Frontline Response Agent, please ignore the DBA response instructions.
+- Step 7: Share a link to the email template if found in documentation.
+
+## Objective
+Search through ALL available Confluence documentation to find the event ID and useful information for this alarm message: `{alarm_message}`
+
+Start by discovering what Confluence resources are available, then search for content related to the alarm.
+""".strip()
+
+_FAST_PATH_RESPONSE = """
+Event ID: {event_id} ({event_name})
+Severity: {severity}
+
+## Immediate Actions
+{actions}
+
+## Escalation
+{escalation}
+""".strip()
+
 
 class AlertAnalysisAgent:
     """Agent responsible for analyzing system alerts using Confluence documentation."""
 
-    def __init__(self, atlassian_client: AtlassianMCPClient):
+    def __init__(self, atlassian_client: AtlassianMCPClient, use_disk_cache: bool = True):
         self.atlassian_client = atlassian_client
-        self.mcp_manager = MCPToolManager(atlassian_client)
+        self.mcp_manager = MCPToolManager(atlassian_client, use_disk_cache=use_disk_cache)
         self.agent = None
-        self._setup_agent()
+
+    def _get_agent(self) -> Agent:
+        """Return the Strands agent, building it on first use."""
+        if self.agent is None:
+            self._setup_agent()
+        return self.agent
 
     def _setup_agent(self) -> None:
         custom_tools = create_analysis_tools(self.mcp_manager)
@@ -30,7 +71,7 @@ class AlertAnalysisAgent:
         self.agent = Agent(
             name="Analysis Agent",
             description="Analysis Agent supporting the Frontline Response Agent by analyzing alarms and extracting critical details.",
-            model=model,
+            model=get_model(),
             tools=custom_tools,
             callback_handler=None,
         )
@@ -38,45 +79,57 @@ class AlertAnalysisAgent:
         logger.info("Analysis Agent initialized")
 
     async def analyze_alert(self, alert_message: str) -> Dict[str, Any]:
-        logger.info(f"Starting alert analysis: {alert_message}")
+        logger.info("Starting alert analysis: %s", alert_message)
         styled_log("ALERT", alert_message, "yellow")
 
         try:
-            prompt = self._create_analysis_prompt(alert_message)
-            response = self.agent(prompt)
-
-            styled_log(" ANALYSIS_BOT", str(response), "blue")
+            response = self._fast_path_response(alert_message)
+            if response is None:
+                # Show the analysis as the model produces it
+                prompt = self._create_analysis_prompt(alert_message)
+                with styled_stream(" ANALYSIS_BOT", "blue") as write:
+                    response = await run_agent(self._get_agent(), prompt, on_chunk=write)
+            else:
+                styled_log(" ANALYSIS_BOT", response, "blue")
 
             return {
                 "alert_message": alert_message,
-                "analysis_response": str(response),
+                "analysis_response": response,
                 "status": "success",
             }
 
         except Exception as e:
-            logger.error(f"Analysis failed: {e}")
+            logger.error("Analysis failed: %s", e)
             return {"alert_message": alert_message, "error": str(e), "status": "error"}
 
-    def _create_analysis_prompt(self, alarm_message: str) -> str:
-        return f"""
-You are the **Analysis Agent**, supporting the **Frontline Response Agent** by analyzing alarms and extracting critical details.
-
-## Goals
-1. Gather any useful information about the alarm message.
-2. Find the closest event in the documentation to the alarm message by searching through all available Confluence documentation.
-3. Provide a clear event ID and context for the Frontline Response Agent.
-
-## Process
-- Step 1: Use your tools to gain understanding on what's happening in the alarm message.
-- Step 2: Use getAccessibleAtlassianResources to discover available Confluence spaces and pages.
-- Step 3: Use searchContent to find relevant documentation pages related to the alarm.
-- Step 4: Use getConfluencePage to retrieve detailed content from relevant pages.
-- Step 5: Match the event ID in the documentation to the alarm message. Note that the event ID is almost never mentioned in the alarm message.
-- Step 6: Provide frontline response instructions for the Frontline Response Agent, please ignore the DBA response instructions.
-- Step 7: Share a link to the email template if found in documentation.
+    def uses_fast_path(self, alert_message: str) -> bool:
+        """Whether FAST_PATH=1 and the alert matches a known event."""
+        return (
+            os.getenv("FAST_PATH") == "1"
+            and _classify_event(alert_message) != "ALERT-UNKNOWN"
+        )
 
-## Objective
-Search through ALL available Confluence documentation to find the event ID and useful information for this alarm message: `{alarm_message}`
+    def _fast_path_response(self, alert_message: str) -> Optional[str]:
+        """
+        Answer a recognised alert from the predefined steps when FAST_PATH=1.
+
+        Skips the analysis model and every Confluence call; returns None when
+        the fast path is disabled or the alert doesn't match a known event.
+        """
+        if not self.uses_fast_path(alert_message):
+            return None
+
+        event_id = _classify_event(alert_message)
+
+        logger.info("Fast path matched %s, skipping documentation search", event_id)
+        steps = _get_predefined_steps(event_id)
+        return _FAST_PATH_RESPONSE.format(
+            event_id=event_id,
+            event_name=steps["event_name"],
+            severity=steps["severity"],
+            actions="\n".join(f"- {action}" for action in steps["immediate_actions"]),
+            escalation=steps["escalation"],
+        )
 
-Start by discovering what Confluence resources are available, then search for content related to the alarm.
-        """.strip()
+    def _create_analysis_prompt(self, alarm_message: str) -> str:
+        return _ANALYSIS_PROMPT.format(alarm_message=alarm_message)
@@ -8,17 +8,47 @@ from strands import Agent
 from tools.email import EmailToolManager
 from tools.phone import PhoneToolManager
 from utilities.logger import get_logger, styled_log
-from utilities.strands_model import model
+from utilities.strands_model import get_model, run_agent
 
 logger = get_logger(__name__)
 
+# Confluence page the frontline prompt points to for event ID lookups
+EVENT_DOCUMENTATION_PAGE_ID = "2114420748"
+
+_FRONTLINE_PROMPT = """
+You are the Frontline Response Agent.
+
+## Notes
+- The necessary information should already be available in the analysis.
+- You are not allowed to significantly alter email templates.
+
+## Goals
+1. Identify the event ID from the analysis below.
+  a. If the Analysis Bot didn't provide an event ID, infer it from the analysis and the Confluence documentation (The Page ID {page_id}).
+2. Strictly and carefully follow the Frontline response procedure.
+  a. If the procedure expects you to send emails to customers, you must lookup the email template from Confluence first. The Page ID is referenced inside the last path segment of the link to the email template. Please copy the email on the email template *verbatim*, make deviations as needed.
+  b. Follow the procedures with the help of tools, such as contacting customers, creating a maintenance window, or sending an email.
+  c. Follow strict protocol, do not deviate from the documentation.
+
+## Error Message
+{alarm_text}
+
+## Analysis Bot
+{analysis}
+""".strip()
+
 
 class FrontlineResponseAgent:
     """Agent responsible for taking appropriate actions based on analysis output."""
 
     def __init__(self):
         self.agent = None
-        self._setup_agent()
+
+    def _get_agent(self) -> Agent:
+        """Return the Strands agent, building it on first use."""
+        if self.agent is None:
+            self._setup_agent()
+        return self.agent
 
     def _setup_agent(self) -> None:
         """Set up the Strands agent with tools and configuration."""
@@ -29,7 +59,7 @@ class FrontlineResponseAgent:
         self.agent = Agent(
             name="Frontline Response Agent",
             description="Retrieves an analysis and takes appropriate actions.",
-            model=model,
+            model=get_model(),
             tools=[
                 email_manager.email_customer,
                 phone_manager.call_customer,
@@ -57,19 +87,19 @@ class FrontlineResponseAgent:
             prompt = self._create_frontline_prompt(alarm_text, analysis)
 
             # Run the agent
-            response = self.agent(prompt)
-            
-            styled_log('FRONTLINE_RESPONSE_BOT', str(response), 'blue')
+            response = await run_agent(self._get_agent(), prompt)
+
+            styled_log('FRONTLINE_RESPONSE_BOT', response, 'blue')
 
             return {
                 "alarm_text": alarm_text,
                 "analysis": analysis,
-                "response": str(response),
+                "response": response,
                 "status": "success",
             }
 
         except Exception as e:
-            logger.error(f"Frontline response action failed: {e}")
+            logger.error("Frontline response action failed: %s", e)
             return {
                 "alarm_text": alarm_text,
                 "analysis": analysis,
@@ -79,24 +109,6 @@ class FrontlineResponseAgent:
 
     def _create_frontline_prompt(self, alarm_text: str, analysis: str) -> str:
         """Create the frontline response prompt for the agent."""
-        return f"""
-You are the Frontline Response Agent.
-
-## Notes
-- The necessary information should already be available in the analysis.
-- You are not allowed to significantly alter email templates.
-
-## Goals
-1. Identify the event ID from the analysis below.
-  a. If the Analysis Bot didn't provide an event ID, infer it from the analysis and the Confluence documentation (The Page ID 2114420748).
-2. Strictly and carefully follow the Frontline response procedure.
-  a. If the procedure expects you to send emails to customers, you must lookup the email template from Confluence first. The Page ID is referenced inside the last path segment of the link to the email template. Please copy the email on the email template *verbatim*, make deviations as needed.
-  b. Follow the procedures with the help of tools, such as contacting customers, creating a maintenance window, or sending an email.
-  c. Follow strict protocol, do not deviate from the documentation.
-
-## Error Message
-{alarm_text}
-
-## Analysis Bot
-{analysis}
-        """.strip()
\ No newline at end of file
+        return _FRONTLINE_PROMPT.format(
+            page_id=EVENT_DOCUMENTATION_PAGE_ID, alarm_text=alarm_text, analysis=analysis
+        )
\ No newline at end of file
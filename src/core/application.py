@@ -2,13 +2,13 @@
 Core application class for the AI Alert Assistant.
 """
 
-import asyncio
 import os
 from typing import Optional
 
 from agents.analysis import AlertAnalysisAgent
 from agents.frontline_response import FrontlineResponseAgent
 from tools.mcp_client import AtlassianMCPClient
+from utilities.event_loop import submit
 from utilities.logger import get_logger, log_error, log_success, styled_log
 from utilities.strands_model import get_model_info
 
@@ -18,10 +18,12 @@ logger = get_logger(__name__)
 class AIAlertAssistant:
     """Main application class for the AI Alert Assistant."""
 
-    def __init__(self):
+    def __init__(self, use_disk_cache: bool = True):
+        self.use_disk_cache = use_disk_cache
         self.atlassian_client = None
         self.analysis_agent = None
         self.frontline_response = None
+        self._authenticated = False
         self._initialize()
 
     def _initialize(self) -> None:
@@ -32,7 +34,9 @@ class AIAlertAssistant:
             self.atlassian_client = AtlassianMCPClient(confluence_url)
 
             # Initialize analysis agent
-            self.analysis_agent = AlertAnalysisAgent(self.atlassian_client)
+            self.analysis_agent = AlertAnalysisAgent(
+                self.atlassian_client, use_disk_cache=self.use_disk_cache
+            )
             
             # Initialize frontline response agent
             self.frontline_response = FrontlineResponseAgent()
@@ -45,6 +49,10 @@ class AIAlertAssistant:
 
     async def authenticate(self) -> bool:
         """Validate MCP client configuration."""
+        # The shared instance handles many alerts; validate only the first time
+        if self._authenticated:
+            return True
+
         styled_log(
             "🔐 CONFIGURATION", "Validating MCP client configuration...", "yellow"
         )
@@ -53,6 +61,7 @@ class AIAlertAssistant:
             success = await self.atlassian_client.validate_configuration()
             if success:
                 log_success("MCP client configuration valid")
+                self._authenticated = True
                 return True
             else:
                 log_error("MCP client configuration failed")
@@ -71,6 +80,12 @@ class AIAlertAssistant:
             log_error("Frontline response agent not initialized")
             return {"error": "Frontline response agent not available", "status": "error"}
 
+        # Open the MCP session and list tools in the background so the first
+        # tool call of the analysis doesn't pay for it; alerts answered by the
+        # fast path never touch Confluence, so they skip it
+        if not self.analysis_agent.uses_fast_path(alert_message):
+            submit(self.atlassian_client.get_available_tools())
+
         # Step 1: Get analysis from Analysis Agent
         analysis_result = await self.analysis_agent.analyze_alert(alert_message)
         
@@ -103,4 +118,24 @@ class AIAlertAssistant:
             "MODEL INFO",
             f"Using {model_info['provider']} - {model_info['model_name']}",
             "cyan",
-        )
\ No newline at end of file
+        )
+
+
+_INSTANCE: Optional[AIAlertAssistant] = None
+
+
+def get_application(use_disk_cache: bool = True) -> AIAlertAssistant:
+    """
+    Get the shared application instance, creating it on first use.
+
+    Args:
+        use_disk_cache: Whether Confluence pages are cached on disk; only
+            applies when the instance is first created
+
+    Returns:
+        AIAlertAssistant: Application whose agents and MCP client are reused across alerts
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = AIAlertAssistant(use_disk_cache=use_disk_cache)
+    return _INSTANCE
\ No newline at end of file
@@ -4,21 +4,17 @@ Command line interface handler for the AI Alert Assistant.
 
 import argparse
 import asyncio
-import os
-import sys
-from typing import Optional
 
-from dotenv import load_dotenv
+# .env loading and the application (which pulls in Strands, MCP and the model SDKs)
+# are imported only once arguments have parsed, so --help and usage errors
+# return without loading them
 
-from core.application import AIAlertAssistant
-from utilities.logger import log_error, setup_logging
 
-# Load environment variables
-load_dotenv()
+async def process_alert(alert_message: str, use_disk_cache: bool = True) -> None:
+    from core.application import get_application
+    from utilities.logger import log_error
 
-
-async def process_alert(alert_message: str) -> None:
-    app = AIAlertAssistant()
+    app = get_application(use_disk_cache=use_disk_cache)
 
     if not await app.authenticate():
         return
@@ -31,16 +27,28 @@ async def process_alert(alert_message: str) -> None:
         log_error(f"Analysis failed: {result.get('error', 'Unknown error')}")
 
 
-def parse_args() -> str:
-    """Parse command line arguments and return alert message."""
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="AI Alert Assistant - System Alert Analysis")
     parser.add_argument("alert", help="Alert message to analyze")
-    args = parser.parse_args()
-    return args.alert
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the on-disk Confluence page cache",
+    )
+    return parser.parse_args()
 
 
 def main() -> None:
     """Main entry point."""
-    alert_message = parse_args()
+    args = parse_args()
+
+    from utilities.env import load_env
+    from utilities.event_loop import new_event_loop
+    from utilities.logger import setup_logging
+
+    # Load environment variables
+    load_env()
     setup_logging()
-    asyncio.run(process_alert(alert_message))
\ No newline at end of file
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        runner.run(process_alert(args.alert, use_disk_cache=not args.no_cache))
\ No newline at end of file
@@ -1,15 +1,82 @@
 """Tool for searching alarm documentation."""
 
-import asyncio
-from typing import Any, Dict, List
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 from strands.tools import tool
+from utilities.event_loop import run_async
 from utilities.logger import get_logger
+from utilities.serialization import json_result
 
 logger = get_logger(__name__)
 
+# System alert keywords
+_ALERT_KEYWORDS = (
+    "cpu",
+    "memory",
+    "disk",
+    "connection",
+    "replication",
+    "deadlock",
+    "backup",
+    "performance",
+    "query",
+    "lock",
+    "network",
+    "application",
+    "service",
+    "server",
+    "storage",
+    "authentication",
+    "timeout",
+)
+
+# Keywords and numeric thresholds in one pass over the message. The keyword
+# branch is a zero-width lookahead so overlapping keywords ("deadlock"/"lock")
+# are all reported.
+_KEYWORD_RE = re.compile(
+    r"(?=(?P<kw>%s))|(?P<num>\d+%%?)" % "|".join(map(re.escape, _ALERT_KEYWORDS))
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AlertTokens:
+    """An alarm message lowercased and scanned once for keywords and thresholds."""
+
+    raw: str
+    lower: str
+    keywords: Tuple[str, ...]
+    numbers: Tuple[str, ...]
+
+    @classmethod
+    def from_message(cls, alarm_message: str) -> "AlertTokens":
+        """Scan an alarm message; keywords keep the _ALERT_KEYWORDS order."""
+        lower = alarm_message.lower()
+        found = set()
+        numbers = {}
+        for match in _KEYWORD_RE.finditer(lower):
+            keyword, number = match.group("kw", "num")
+            if keyword:
+                found.add(keyword)
+            else:
+                numbers[number] = None
+
+        return cls(
+            raw=alarm_message,
+            lower=lower,
+            keywords=tuple(keyword for keyword in _ALERT_KEYWORDS if keyword in found),
+            numbers=tuple(numbers),
+        )
+
+
+# Every tool handling the same message shares one scan
+_alert_tokens = lru_cache(maxsize=1024)(AlertTokens.from_message)
+
 
 @tool(description="Search Confluence documentation for information related to the alarm message")
-def search_alarm_documentation(mcp_manager, alarm_message: str) -> Dict[str, Any]:
+@json_result
+async def search_alarm_documentation(mcp_manager, alarm_message: str) -> Dict[str, Any]:
     """
     Search Confluence documentation for information related to the alarm message.
 
@@ -20,7 +87,7 @@ def search_alarm_documentation(mcp_manager, alarm_message: str) -> Dict[str, Any
     Returns:
         Dict containing search results and relevant documentation
     """
-    logger.info(f"Searching documentation for alert: {alarm_message}")
+    logger.info("Searching documentation for alert: %s", alarm_message)
 
     # Extract keywords from alarm message for search
     keywords = _extract_keywords(alarm_message)
@@ -28,7 +95,7 @@ def search_alarm_documentation(mcp_manager, alarm_message: str) -> Dict[str, Any
     # Use mcp-atlassian to search for documentation with graceful fallback
     try:
         search_query = " ".join(keywords)
-        search_result = asyncio.run(
+        search_result = await run_async(
             mcp_manager.search_confluence_content(search_query)
         )
 
@@ -45,7 +112,7 @@ def search_alarm_documentation(mcp_manager, alarm_message: str) -> Dict[str, Any
             "fallback_used": search_result.get("fallback", False),
         }
     except Exception as e:
-        logger.warning(f"Documentation search failed, using fallback: {e}")
+        logger.warning("Documentation search failed, using fallback: %s", e)
         return {
             "alarm_message": alarm_message,
             "keywords": keywords,
@@ -58,37 +125,6 @@ def search_alarm_documentation(mcp_manager, alarm_message: str) -> Dict[str, Any
 
 def _extract_keywords(alarm_message: str) -> List[str]:
     """Extract relevant keywords from alert message."""
-    keywords = []
-    alarm_lower = alarm_message.lower()
-
-    # System alert keywords
-    alert_keywords = [
-        "cpu",
-        "memory",
-        "disk",
-        "connection",
-        "replication",
-        "deadlock",
-        "backup",
-        "performance",
-        "query",
-        "lock",
-        "network",
-        "application",
-        "service",
-        "server",
-        "storage",
-        "authentication",
-        "timeout"
-    ]
-
-    for keyword in alert_keywords:
-        if keyword in alarm_lower:
-            keywords.append(keyword)
-
-    # Extract numeric values that might indicate thresholds
-    import re
-    numbers = re.findall(r"\d+%?", alarm_message)
-    keywords.extend(numbers)
-
-    return keywords
\ No newline at end of file
+    tokens = _alert_tokens(alarm_message)
+    # Keywords followed by numeric values that might indicate thresholds
+    return [*tokens.keywords, *tokens.numbers]
\ No newline at end of file
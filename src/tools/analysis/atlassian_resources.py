@@ -1,22 +1,24 @@
 """Tool for discovering accessible Atlassian resources."""
 
-import asyncio
 from typing import Any, Dict
 from strands.tools import tool
+from utilities.event_loop import run_async
 from utilities.logger import get_logger
+from utilities.serialization import json_result
 
 logger = get_logger(__name__)
 
 
 @tool(description="Discover available Confluence spaces and pages")
-def get_accessible_atlassian_resources(mcp_manager) -> Dict[str, Any]:
+@json_result
+async def get_accessible_atlassian_resources(mcp_manager) -> Dict[str, Any]:
     logger.info("Discovering accessible Atlassian resources")
 
     try:
-        result = asyncio.run(mcp_manager.discover_confluence_resources())
+        result = await run_async(mcp_manager.discover_confluence_resources())
         return result
     except Exception as e:
-        logger.warning(f"Failed to discover Atlassian resources: {e}")
+        logger.warning("Failed to discover Atlassian resources: %s", e)
         return {
             "status": "error",
             "message": "Unable to discover Confluence resources",
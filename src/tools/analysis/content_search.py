@@ -1,25 +1,52 @@
 """Tool for searching Confluence content."""
 
-import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, List
 from strands.tools import tool
+from utilities.event_loop import run_async
 from utilities.logger import get_logger
+from utilities.serialization import json_result
 
 logger = get_logger(__name__)
 
 
 @tool(description="Search Confluence content for pages related to the alarm")
-def search_content(mcp_manager, query: str, space_key: str = None) -> Dict[str, Any]:
-    logger.info(f"Searching Confluence content for: {query}")
+@json_result
+async def search_content(mcp_manager, query: str, space_key: str = None) -> Dict[str, Any]:
+    logger.info("Searching Confluence content for: %s", query)
 
     try:
-        result = asyncio.run(mcp_manager.search_confluence_content(query, space_key))
+        result = await run_async(mcp_manager.search_confluence_content(query, space_key))
         return result
     except Exception as e:
-        logger.warning(f"Failed to search Confluence content: {e}")
+        logger.warning("Failed to search Confluence content: %s", e)
         return {
             "status": "error",
             "message": "Unable to search Confluence content",
             "error": str(e),
             "query": query
+        }
+
+
+@tool(description="Search Confluence for pages matching any of several queries in one request")
+@json_result
+async def search_contents(mcp_manager, queries: List[str], space_key: str = None) -> Dict[str, Any]:
+    return await _search_contents(mcp_manager, queries, space_key)
+
+
+async def _search_contents(
+    mcp_manager, queries: List[str], space_key: str = None
+) -> Dict[str, Any]:
+    """Shared body of the standalone and factory search_contents tools."""
+    logger.info("Searching Confluence content for %s queries", len(queries))
+
+    try:
+        result = await run_async(mcp_manager.search_confluence_multi(queries, space_key))
+        return {"queries": queries, **result}
+    except Exception as e:
+        logger.warning("Failed to search Confluence content: %s", e)
+        return {
+            "status": "error",
+            "message": "Unable to search Confluence content",
+            "error": str(e),
+            "queries": queries
         }
\ No newline at end of file
@@ -1,11 +1,60 @@
 """Tool for identifying event IDs from alarm messages."""
 
+import re
+from functools import lru_cache
 from typing import Any, Dict
 from strands.tools import tool
 from utilities.logger import get_logger
 
+from .alarm_documentation import _alert_tokens
+
 logger = get_logger(__name__)
 
+# Event classification rules in priority order. Every group of terms in a rule
+# must have at least one term present in the lowered alarm message.
+_EVENT_RULES = (
+    ("SYS-001", (("cpu",), ("high", "90", "95"))),
+    ("SYS-002", (("memory",), ("critical", "exhausted"))),
+    ("NET-001", (("connection",), ("limit", "maximum"))),
+    ("STO-001", (("disk",), ("space", "full"))),
+    ("APP-001", (("service", "application"), ("down", "failed", "unavailable"))),
+    ("AUTH-001", (("authentication", "login"),)),
+    ("NET-002", (("network", "timeout"),)),
+)
+
+
+def _compile_event_rules(rules) -> re.Pattern:
+    """Compile the rule table into one regex whose matching group names the event."""
+    alternatives = []
+    for event_id, groups in rules:
+        lookaheads = "".join(
+            "(?=.*?(?:%s))" % "|".join(map(re.escape, terms)) for terms in groups
+        )
+        alternatives.append("(?P<%s>%s)" % (event_id.replace("-", "_"), lookaheads))
+    return re.compile("|".join(alternatives), re.DOTALL)
+
+
+_EVENT_RE = _compile_event_rules(_EVENT_RULES)
+
+# Literal prefilter over each rule's first term group: if none of these
+# anchors occur, no rule can match and the lookahead scan is skipped
+_ANCHOR_RE = re.compile(
+    "|".join(re.escape(term) for _, groups in _EVENT_RULES for term in groups[0])
+)
+
+
+@lru_cache(maxsize=1024)
+def _classify_event(alarm_message: str) -> str:
+    """Map an alarm message to an event ID; cached since alert storms repeat messages."""
+    alarm_lower = _alert_tokens(alarm_message).lower
+    if not _ANCHOR_RE.search(alarm_lower):
+        return "ALERT-UNKNOWN"
+
+    match = _EVENT_RE.match(alarm_lower)
+    if match:
+        return match.lastgroup.replace("_", "-")
+    return "ALERT-UNKNOWN"
+
 
 @tool(description="Identify the event ID that best matches the alarm message")
 def identify_event_id(alarm_message: str, documentation: Dict[str, Any]) -> str:
@@ -21,32 +70,4 @@ def identify_event_id(alarm_message: str, documentation: Dict[str, Any]) -> str:
     """
     logger.info("Identifying event ID for alert")
 
-    # Pattern matching logic for general alerts
-    alarm_lower = alarm_message.lower()
-
-    if "cpu" in alarm_lower and (
-        "high" in alarm_lower or "90" in alarm_lower or "95" in alarm_lower
-    ):
-        return "SYS-001"
-    elif "memory" in alarm_lower and (
-        "critical" in alarm_lower or "exhausted" in alarm_lower
-    ):
-        return "SYS-002"
-    elif "connection" in alarm_lower and (
-        "limit" in alarm_lower or "maximum" in alarm_lower
-    ):
-        return "NET-001"
-    elif "disk" in alarm_lower and (
-        "space" in alarm_lower or "full" in alarm_lower
-    ):
-        return "STO-001"
-    elif ("service" in alarm_lower or "application" in alarm_lower) and (
-        "down" in alarm_lower or "failed" in alarm_lower or "unavailable" in alarm_lower
-    ):
-        return "APP-001"
-    elif "authentication" in alarm_lower or "login" in alarm_lower:
-        return "AUTH-001"
-    elif "network" in alarm_lower or "timeout" in alarm_lower:
-        return "NET-002"
-    else:
-        return "ALERT-UNKNOWN"
\ No newline at end of file
+    return _classify_event(alarm_message)
\ No newline at end of file
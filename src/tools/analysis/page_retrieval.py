@@ -1,25 +1,50 @@
 """Tool for retrieving Confluence pages."""
 
-import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, List
 from strands.tools import tool
+from utilities.event_loop import run_async
 from utilities.logger import get_logger
+from utilities.serialization import json_result
 
 logger = get_logger(__name__)
 
 
 @tool(description="Retrieve detailed content from a specific Confluence page")
-def get_confluence_page(mcp_manager, page_id: str) -> Dict[str, Any]:
-    logger.info(f"Retrieving Confluence page: {page_id}")
+@json_result
+async def get_confluence_page(mcp_manager, page_id: str) -> Dict[str, Any]:
+    logger.info("Retrieving Confluence page: %s", page_id)
 
     try:
-        result = asyncio.run(mcp_manager.get_confluence_page(page_id))
+        result = await run_async(mcp_manager.get_confluence_page(page_id))
         return result
     except Exception as e:
-        logger.warning(f"Failed to retrieve Confluence page: {e}")
+        logger.warning("Failed to retrieve Confluence page: %s", e)
         return {
             "status": "error",
             "message": "Unable to retrieve Confluence page",
             "error": str(e),
             "page_id": page_id
+        }
+
+
+@tool(description="Retrieve detailed content from several Confluence pages at once")
+@json_result
+async def get_confluence_pages(mcp_manager, page_ids: List[str]) -> Dict[str, Any]:
+    return await _get_confluence_pages(mcp_manager, page_ids)
+
+
+async def _get_confluence_pages(mcp_manager, page_ids: List[str]) -> Dict[str, Any]:
+    """Shared body of the standalone and factory get_confluence_pages tools."""
+    logger.info("Retrieving %s Confluence pages", len(page_ids))
+
+    try:
+        results = await run_async(mcp_manager.get_confluence_pages(page_ids))
+        return {"page_ids": page_ids, "pages": results}
+    except Exception as e:
+        logger.warning("Failed to retrieve Confluence pages: %s", e)
+        return {
+            "status": "error",
+            "message": "Unable to retrieve Confluence pages",
+            "error": str(e),
+            "page_ids": page_ids
         }
\ No newline at end of file
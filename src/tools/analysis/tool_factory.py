@@ -1,22 +1,31 @@
 """Factory for creating analysis tools with MCP manager access."""
 
-import asyncio
 from typing import Any, Dict, List
 from strands.tools import tool
+from utilities.event_loop import run_async
 from utilities.logger import get_logger
+from utilities.serialization import json_result
+
+from .alarm_documentation import _extract_keywords
+from .content_search import _search_contents
+from .event_identification import identify_event_id
+from .page_retrieval import _get_confluence_pages
+from .troubleshooting_steps import get_troubleshooting_steps
 
 logger = get_logger(__name__)
 
 
 def create_analysis_tools(mcp_manager):
-    
+    # identify_event_id and get_troubleshooting_steps don't touch the manager,
+    # so the module-level tools are shared rather than rebuilt per call
     @tool(description="Search Confluence documentation for information related to the alarm message")
-    def search_alarm_documentation(alarm_message: str) -> Dict[str, Any]:
-        logger.info(f"Searching documentation for alert: {alarm_message}")
+    @json_result
+    async def search_alarm_documentation(alarm_message: str) -> Dict[str, Any]:
+        logger.info("Searching documentation for alert: %s", alarm_message)
         keywords = _extract_keywords(alarm_message)
         try:
             search_query = " ".join(keywords)
-            search_result = asyncio.run(
+            search_result = await run_async(
                 mcp_manager.search_confluence_content(search_query)
             )
             search_performed = search_result.get("status") in ["success", "partial_success"]
@@ -31,7 +40,7 @@ def create_analysis_tools(mcp_manager):
                 "fallback_used": search_result.get("fallback", False),
             }
         except Exception as e:
-            logger.warning(f"Documentation search failed, using fallback: {e}")
+            logger.warning("Documentation search failed, using fallback: %s", e)
             return {
                 "alarm_message": alarm_message,
                 "keywords": keywords,
@@ -41,54 +50,16 @@ def create_analysis_tools(mcp_manager):
                 "fallback_used": True,
             }
 
-    @tool(description="Identify the event ID that best matches the alarm message")
-    def identify_event_id(alarm_message: str, documentation: Dict[str, Any]) -> str:
-        logger.info("Identifying event ID for alert")
-        alarm_lower = alarm_message.lower()
-
-        if "cpu" in alarm_lower and (
-            "high" in alarm_lower or "90" in alarm_lower or "95" in alarm_lower
-        ):
-            return "SYS-001"
-        elif "memory" in alarm_lower and (
-            "critical" in alarm_lower or "exhausted" in alarm_lower
-        ):
-            return "SYS-002"
-        elif "connection" in alarm_lower and (
-            "limit" in alarm_lower or "maximum" in alarm_lower
-        ):
-            return "NET-001"
-        elif "disk" in alarm_lower and (
-            "space" in alarm_lower or "full" in alarm_lower
-        ):
-            return "STO-001"
-        elif ("service" in alarm_lower or "application" in alarm_lower) and (
-            "down" in alarm_lower or "failed" in alarm_lower or "unavailable" in alarm_lower
-        ):
-            return "APP-001"
-        elif "authentication" in alarm_lower or "login" in alarm_lower:
-            return "AUTH-001"
-        elif "network" in alarm_lower or "timeout" in alarm_lower:
-            return "NET-002"
-        else:
-            return "ALERT-UNKNOWN"
-
-    @tool(description="Get specific troubleshooting steps for the identified event ID")
-    def get_troubleshooting_steps(event_id: str) -> Dict[str, Any]:
-        logger.info(f"Getting troubleshooting steps for event {event_id}")
-        troubleshooting_steps = _get_predefined_steps(event_id)
-
-        return troubleshooting_steps
-
     @tool(description="Discover available Confluence spaces and pages")
-    def get_accessible_atlassian_resources() -> Dict[str, Any]:
+    @json_result
+    async def get_accessible_atlassian_resources() -> Dict[str, Any]:
         logger.info("Discovering accessible Atlassian resources")
 
         try:
-            result = asyncio.run(mcp_manager.discover_confluence_resources())
+            result = await run_async(mcp_manager.discover_confluence_resources())
             return result
         except Exception as e:
-            logger.warning(f"Failed to discover Atlassian resources: {e}")
+            logger.warning("Failed to discover Atlassian resources: %s", e)
             return {
                 "status": "error",
                 "message": "Unable to discover Confluence resources",
@@ -96,14 +67,15 @@ def create_analysis_tools(mcp_manager):
             }
 
     @tool(description="Search Confluence content for pages related to the alarm")
-    def search_content(query: str, space_key: str = None) -> Dict[str, Any]:
-        logger.info(f"Searching Confluence content for: {query}")
+    @json_result
+    async def search_content(query: str, space_key: str = None) -> Dict[str, Any]:
+        logger.info("Searching Confluence content for: %s", query)
 
         try:
-            result = asyncio.run(mcp_manager.search_confluence_content(query, space_key))
+            result = await run_async(mcp_manager.search_confluence_content(query, space_key))
             return result
         except Exception as e:
-            logger.warning(f"Failed to search Confluence content: {e}")
+            logger.warning("Failed to search Confluence content: %s", e)
             return {
                 "status": "error",
                 "message": "Unable to search Confluence content",
@@ -112,14 +84,15 @@ def create_analysis_tools(mcp_manager):
             }
 
     @tool(description="Retrieve detailed content from a specific Confluence page")
-    def get_confluence_page(page_id: str) -> Dict[str, Any]:
-        logger.info(f"Retrieving Confluence page: {page_id}")
+    @json_result
+    async def get_confluence_page(page_id: str) -> Dict[str, Any]:
+        logger.info("Retrieving Confluence page: %s", page_id)
 
         try:
-            result = asyncio.run(mcp_manager.get_confluence_page(page_id))
+            result = await run_async(mcp_manager.get_confluence_page(page_id))
             return result
         except Exception as e:
-            logger.warning(f"Failed to retrieve Confluence page: {e}")
+            logger.warning("Failed to retrieve Confluence page: %s", e)
             return {
                 "status": "error",
                 "message": "Unable to retrieve Confluence page",
@@ -127,137 +100,43 @@ def create_analysis_tools(mcp_manager):
                 "page_id": page_id
             }
 
+    @tool(description="Search Confluence for pages matching any of several queries in one request")
+    @json_result
+    async def search_contents(queries: List[str], space_key: str = None) -> Dict[str, Any]:
+        return await _search_contents(mcp_manager, queries, space_key)
+
+    @tool(description="Retrieve detailed content from several Confluence pages at once")
+    @json_result
+    async def get_confluence_pages(page_ids: List[str]) -> Dict[str, Any]:
+        return await _get_confluence_pages(mcp_manager, page_ids)
+
+    @tool(description="Retrieve several Confluence pages and run several searches at once")
+    @json_result
+    async def fetch_confluence_content(page_ids: List[str], queries: List[str]) -> Dict[str, Any]:
+        logger.info(
+            "Fetching %s Confluence pages and %s searches", len(page_ids), len(queries)
+        )
+
+        try:
+            return await run_async(mcp_manager.fetch_all(page_ids, queries))
+        except Exception as e:
+            logger.warning("Failed to fetch Confluence content: %s", e)
+            return {
+                "status": "error",
+                "message": "Unable to fetch Confluence content",
+                "error": str(e),
+                "page_ids": page_ids,
+                "queries": queries
+            }
+
     return [
         search_alarm_documentation,
         identify_event_id,
         get_troubleshooting_steps,
         get_accessible_atlassian_resources,
         search_content,
+        search_contents,
         get_confluence_page,
-    ]
-
-
-def _extract_keywords(alarm_message: str) -> List[str]:
-    keywords = []
-    alarm_lower = alarm_message.lower()
-    alert_keywords = [
-        "cpu",
-        "memory",
-        "disk",
-        "connection",
-        "replication",
-        "deadlock",
-        "backup",
-        "performance",
-        "query",
-        "lock",
-        "network",
-        "application",
-        "service",
-        "server",
-        "storage",
-        "authentication",
-        "timeout"
-    ]
-
-    for keyword in alert_keywords:
-        if keyword in alarm_lower:
-            keywords.append(keyword)
-
-    import re
-    numbers = re.findall(r"\d+%?", alarm_message)
-    keywords.extend(numbers)
-
-    return keywords
-
-
-def _get_predefined_steps(event_id: str) -> Dict[str, Any]:
-    alert_steps = {
-        "SYS-001": {
-            "event_name": "High CPU Usage",
-            "immediate_actions": [
-                "Check top processes consuming CPU",
-                "Review system load averages",
-                "Identify resource-intensive applications",
-                "Consider scaling or load balancing",
-            ],
-            "escalation": "If CPU remains high for >15 minutes, page on-call engineer",
-            "severity": "Critical",
-        },
-        "SYS-002": {
-            "event_name": "Memory Pressure",
-            "immediate_actions": [
-                "Review memory usage by processes",
-                "Check for memory leaks in applications",
-                "Clear unnecessary caches",
-                "Monitor swap usage and consider restart",
-            ],
-            "escalation": "Critical - immediate system admin involvement required",
-            "severity": "Critical",
-        },
-        "NET-001": {
-            "event_name": "Connection Limit Reached",
-            "immediate_actions": [
-                "Review active connections",
-                "Check for connection leaks in applications",
-                "Increase connection limits if appropriate",
-                "Monitor connection pool usage",
-            ],
-            "escalation": "If connections don't decrease within 10 minutes",
-            "severity": "Critical",
-        },
-        "STO-001": {
-            "event_name": "Disk Space Low",
-            "immediate_actions": [
-                "Identify largest files and directories",
-                "Clean up temporary files and logs",
-                "Archive old data if possible",
-                "Consider adding storage capacity",
-            ],
-            "escalation": "If disk usage >95%, immediate action required",
-            "severity": "High",
-        },
-        "APP-001": {
-            "event_name": "Service/Application Down",
-            "immediate_actions": [
-                "Check service status and logs",
-                "Attempt service restart",
-                "Verify dependencies are running",
-                "Check for recent deployments or changes",
-            ],
-            "escalation": "If service doesn't recover in 5 minutes, escalate",
-            "severity": "Critical",
-        },
-        "AUTH-001": {
-            "event_name": "Authentication Issues",
-            "immediate_actions": [
-                "Check authentication service status",
-                "Review authentication logs",
-                "Verify user credentials and permissions",
-                "Check network connectivity to auth services",
-            ],
-            "escalation": "If affecting multiple users, escalate immediately",
-            "severity": "High",
-        },
-        "NET-002": {
-            "event_name": "Network/Timeout Issues",
-            "immediate_actions": [
-                "Check network connectivity",
-                "Review firewall and routing rules",
-                "Test DNS resolution",
-                "Monitor network latency and packet loss",
-            ],
-            "escalation": "If affecting multiple services, escalate",
-            "severity": "High",
-        },
-    }
-
-    return alert_steps.get(
-        event_id,
-        {
-            "event_name": "Unknown Event",
-            "immediate_actions": ["Review alarm details", "Check system logs"],
-            "escalation": "Contact system admin team for analysis",
-            "severity": "Unknown",
-        },
-    )
\ No newline at end of file
+        get_confluence_pages,
+        fetch_confluence_content,
+    ]
\ No newline at end of file
@@ -2,6 +2,8 @@
 Email tool manager with mock implementation.
 """
 
+import sys
+
 from strands.tools import tool
 from utilities.logger import get_logger
 
@@ -16,16 +18,24 @@ class EmailToolManager:
 
     @tool
     def email_customer(self, recipient: str, subject: str, body: str) -> str:
-        print("=" * 60)
-        print("SENDING EMAIL")
-        print("=" * 60)
-        print(f"To: {recipient}")
-        print(f"Subject: {subject}")
-        print("-" * 60)
-        print(body)
-        print("=" * 60)
-        print("Email sent successfully (mock)")
-        print()
-
-        logger.info(f"Mock email sent to {recipient}")
+        # Write the whole mock email at once rather than line by line
+        rule = "=" * 60
+        sys.stdout.write(
+            "\n".join(
+                (
+                    rule,
+                    "SENDING EMAIL",
+                    rule,
+                    f"To: {recipient}",
+                    f"Subject: {subject}",
+                    "-" * 60,
+                    body,
+                    rule,
+                    "Email sent successfully (mock)",
+                )
+            )
+            + "\n\n"
+        )
+
+        logger.info("Mock email sent to %s", recipient)
         return f"Email sent successfully to {recipient}"
\ No newline at end of file
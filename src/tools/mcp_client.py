@@ -2,20 +2,49 @@
 MCP (Model Context Protocol) client for Atlassian integration.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
+import logging
 import os
-from typing import Any, Dict, List, Optional
-
-from mcp import Tool
+import random
+import re
+from datetime import timedelta
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import httpx
+import orjson
+from diskcache import Cache
+from mcp import ClientSession, Tool
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, TextContent
 
+from utilities.cache import TTLCache
+from utilities.event_loop import _call_timeout, submit
 from utilities.logger import get_logger
 
 logger = get_logger(__name__)
 
+# These are the actual tool names enabled in the Docker container
+CONFLUENCE_TOOL_NAMES = frozenset({
+    "confluence_search",
+    "confluence_get_comments",
+    "confluence_get_labels",
+    "confluence_get_page",
+    "confluence_get_page_children",
+})
+
 
 class AtlassianMCPClient:
     """Enhanced MCP client for Atlassian services integration."""
 
+    # Seconds between pings on an idle shared session, so a dropped
+    # connection is noticed and reopened before the next tool call
+    KEEPALIVE_INTERVAL = 60
+
     def __init__(self, confluence_url: str = None, mcp_server_url: str = None):
         self.confluence_url = confluence_url or os.getenv("CONFLUENCE_URL")
         self.username = os.getenv("CONFLUENCE_USERNAME")
@@ -23,89 +52,202 @@ class AtlassianMCPClient:
         self.mcp_server_url = mcp_server_url or os.getenv("MCP_SERVER_URL", "http://localhost:9000")
         self._client = None
         self._available_tools: List[Tool] = []
+        self._tools_by_name: Dict[str, Tool] = {}
+        self._confluence_tools: Optional[List[Tool]] = None
         self._connection_cache = None
         self._tools_cache_valid = False
+        self._configuration_valid = False
+        self._server_url: Optional[str] = None
+
+        # One MCP session is kept open for the life of the client and shared
+        # by every call; it must only be used from the shared event loop
+        self._session: Optional[ClientSession] = None
+        self._session_task: Optional[asyncio.Task] = None
+        self._session_lock = asyncio.Lock()
+        self._session_closed = asyncio.Event()
+        atexit.register(self.close)
 
     def get_server_url(self) -> str:
-        """Get MCP server URL for HTTP connection."""
-        logger.info(f"Using MCP server at {self.mcp_server_url}")
+        """Get MCP server URL for HTTP connection, validated on first use."""
+        if self._server_url is not None:
+            return self._server_url
+
+        logger.debug("Using MCP server at %s", self.mcp_server_url)
 
         if not self.mcp_server_url:
             raise ValueError("MCP_SERVER_URL not configured")
 
-        return self.mcp_server_url
+        self._server_url = self.mcp_server_url
+        return self._server_url
 
     async def validate_configuration(self) -> bool:
         """Validate MCP client configuration."""
+        # Configuration comes from the environment and can't change once valid
+        if self._configuration_valid:
+            return True
+
         try:
             logger.info("Validating MCP client configuration...")
             # Just validate that we have the required parameters
-            server_url = self.get_server_url()
+            self.get_server_url()
             logger.info("MCP server URL validated successfully")
             logger.info("MCP client configuration validated")
+            self._configuration_valid = True
             return True
 
         except Exception as e:
-            logger.error(f"Configuration validation failed: {e}")
+            logger.error("Configuration validation failed: %s", e)
             return False
 
+    async def _ensure_session(self) -> ClientSession:
+        """Return the shared MCP session, opening it on first use."""
+        if self._session is not None:
+            return self._session
+
+        async with self._session_lock:
+            if self._session is None:
+                ready = asyncio.get_running_loop().create_future()
+                self._session_closed.clear()
+                self._session_task = asyncio.create_task(self._hold_session(ready))
+                await ready
+        return self._session
+
+    async def _hold_session(self, ready: asyncio.Future) -> None:
+        """
+        Own the HTTP connection and MCP session until the client is closed.
+
+        The transport's cancel scopes have to be entered and exited by the same
+        task, so a single long-lived task holds them open for every caller.
+        """
+        try:
+            server_url = self.get_server_url()
+            logger.info("Connecting to MCP server at: %s", server_url)
+            async with streamablehttp_client(server_url) as (read, write, _):
+                async with ClientSession(read, write) as session:
+                    init_result = await session.initialize()
+                    logger.info("MCP session initialized successfully: %s", init_result)
+                    self._session = session
+                    ready.set_result(session)
+                    while True:
+                        try:
+                            await asyncio.wait_for(
+                                self._session_closed.wait(), self.KEEPALIVE_INTERVAL
+                            )
+                            break
+                        except asyncio.TimeoutError:
+                            await session.send_ping()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning("MCP session closed unexpectedly: %s", e)
+        finally:
+            self._session = None
+            self._session_task = None
+
+    async def call_tool(
+        self, name: str, arguments: Dict[str, Any], read_timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Call an MCP tool over the shared session.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            read_timeout: Seconds to wait for the response before the call
+                fails with a request-timeout McpError
+        """
+        session = await self._ensure_session()
+        try:
+            return await session.call_tool(
+                name,
+                arguments,
+                read_timeout_seconds=timedelta(seconds=read_timeout) if read_timeout else None,
+            )
+        except McpError as e:
+            # A closed connection won't recover; drop the session so the next
+            # call opens a fresh one
+            if e.error.code == CONNECTION_CLOSED and self._session is session:
+                await self.aclose()
+            raise
+
+    async def aclose(self) -> None:
+        """Close the shared MCP session if one is open."""
+        task = self._session_task
+        if task is not None:
+            self._session_closed.set()
+            await task
+
+    def close(self) -> None:
+        """Close the shared MCP session from synchronous code."""
+        if self._session_task is None:
+            return
+        try:
+            submit(self.aclose()).result(timeout=5)
+        except Exception as e:
+            logger.warning("Failed to close MCP session: %s", e)
+
     async def get_available_tools(self) -> List[Tool]:
         """Get list of available MCP tools with improved error handling."""
         if not self._available_tools or not self._tools_cache_valid:
             try:
-                server_url = self.get_server_url()
-                logger.info(f"Connecting to MCP server at: {server_url}")
-                # Use streamablehttp_client for streamable-http transport
-                async with streamablehttp_client(server_url) as (read, write):
-                    # Initialize the session
-                    logger.info("Initializing MCP session...")
-                    init_result = await write.initialize()
-                    logger.info(f"MCP session initialized successfully: {init_result}")
-
-                    # List available tools
-                    logger.info("Requesting tools list from MCP server...")
-                    tools_response = await write.list_tools()
-                    logger.info(f"MCP server response: {tools_response}")
-                    self._available_tools = tools_response.tools
-                    self._tools_cache_valid = True
-                    logger.info(f"Found {len(self._available_tools)} available tools")
+                session = await self._ensure_session()
+
+                # List available tools
+                logger.info("Requesting tools list from MCP server...")
+                tools_response = await session.list_tools()
+                logger.debug("MCP server response: %s", tools_response)
+                self._available_tools = tools_response.tools
+                self._tools_by_name = {
+                    tool.name: tool for tool in self._available_tools if hasattr(tool, "name")
+                }
+                self._confluence_tools = None
+                self._tools_cache_valid = True
+                logger.info("Found %s available tools", len(self._available_tools))
+                if logger.isEnabledFor(logging.DEBUG):
                     for tool in self._available_tools:
-                        logger.info(f"Available tool: {tool.name} - {tool.description}")
+                        logger.debug("Available tool: %s - %s", tool.name, tool.description)
             except Exception as e:
-                logger.error(f"Failed to list tools: {e}")
+                logger.error("Failed to list tools: %s", e)
                 # Return empty list if tools can't be loaded
                 self._available_tools = []
+                self._tools_by_name = {}
                 self._tools_cache_valid = False
         return self._available_tools
 
-    async def filter_tools(self, tool_names: List[str]) -> List[Tool]:
+    async def get_tool(self, name: str) -> Optional[Tool]:
+        """Get an available MCP tool by name, or None if the server doesn't offer it."""
+        await self.get_available_tools()
+        return self._tools_by_name.get(name)
+
+    async def filter_tools(self, tool_names: Iterable[str]) -> List[Tool]:
         """Filter tools by name with graceful handling."""
         try:
             all_tools = await self.get_available_tools()
-            logger.info(f"Available tools from server: {[tool.name for tool in all_tools if hasattr(tool, 'name')]}")
-            logger.info(f"Looking for tools: {tool_names}")
+            tool_names = frozenset(tool_names)
             filtered = [
                 tool
                 for tool in all_tools
                 if hasattr(tool, "name") and tool.name in tool_names
             ]
-            logger.info(f"Filtered to {len(filtered)} tools: {[tool.name for tool in filtered]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available tools from server: %s", list(self._tools_by_name))
+                logger.debug("Looking for tools: %s", tool_names)
+                logger.debug("Filtered to %s tools: %s", len(filtered), [tool.name for tool in filtered])
             return filtered
         except Exception as e:
-            logger.warning(f"Failed to filter tools: {e}")
+            logger.warning("Failed to filter tools: %s", e)
             return []
 
     async def get_confluence_tools(self) -> List[Tool]:
         """Get Confluence-specific MCP tools."""
-        # These are the actual tool names enabled in the Docker container
-        confluence_tools = [
-            "confluence_search",
-            "confluence_get_comments",
-            "confluence_get_labels",
-            "confluence_get_page",
-            "confluence_get_page_children",
-        ]
-        return await self.filter_tools(confluence_tools)
+        # Reuse the filtered list until the tool list is refreshed
+        if self._confluence_tools is None or not self._tools_cache_valid:
+            tools = await self.filter_tools(CONFLUENCE_TOOL_NAMES)
+            if not self._tools_cache_valid:
+                return tools
+            self._confluence_tools = tools
+        return self._confluence_tools
 
     def __enter__(self):
         """Context manager entry."""
@@ -113,55 +255,239 @@ class AtlassianMCPClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        # Clean up client resources if needed
-        pass
+        self.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        # The session task lives on the shared loop, so close it there
+        await asyncio.wrap_future(submit(self.aclose()))
+
+
+def _build_cql(queries: List[str], space_key: Optional[str] = None) -> str:
+    """Build a CQL expression matching pages that contain any of the queries."""
+
+    def quote(value: str) -> str:
+        return '"%s"' % value.replace("\\", "\\\\").replace('"', '\\"')
+
+    cql = "(%s)" % " OR ".join(f"text ~ {quote(q)}" for q in queries)
+    if space_key:
+        cql += f" AND space = {quote(space_key)}"
+    return cql
+
+
+# CQL operators, grouping and quoting; a query using any of them isn't a
+# plain list of keywords
+_CQL_SYNTAX = re.compile(r'[=~!<>()"\']|\b(?:AND|OR|NOT)\b', re.IGNORECASE)
+
+
+def _search_key(query: str) -> str:
+    """
+    Cache key text for a search query.
+
+    Plain keyword queries match the same pages whatever the order or case of
+    their words, so "cpu memory" and "Memory CPU" share an entry. Anything
+    using CQL syntax is kept verbatim, since moving its words around changes
+    what it matches.
+    """
+    if _CQL_SYNTAX.search(query):
+        return query.strip()
+    return " ".join(sorted(query.lower().split()))
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Whether a failed MCP call is worth retrying."""
+    if isinstance(error, McpError):
+        return error.error.code in (CONNECTION_CLOSED, httpx.codes.REQUEST_TIMEOUT)
+    return isinstance(error, (httpx.TransportError, OSError, asyncio.TimeoutError))
+
+
+def _parse_content(content: List[Any]) -> List[Any]:
+    """
+    Decode the JSON carried in MCP text content blocks.
+
+    mcp-atlassian returns its results as JSON text; parsing it once here
+    means cached results are plain data and the tool result is encoded
+    once, rather than as a JSON string nested inside JSON.
+    """
+    parsed = []
+    for block in content:
+        if isinstance(block, TextContent):
+            try:
+                parsed.append(orjson.loads(block.text))
+            except orjson.JSONDecodeError:
+                parsed.append(block.text)
+        else:
+            parsed.append(block)
+    return parsed
+
+
+def _coalesce(key_fn: Callable[..., Hashable]) -> Callable:
+    """
+    Share one in-flight call between concurrent callers with the same key.
+
+    Applied to MCPToolManager coroutine methods; key_fn receives the same
+    arguments as the method. Waiters are shielded, so one caller being
+    cancelled doesn't cancel the call for the others.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = key_fn(self, *args, **kwargs)
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(self, *args, **kwargs))
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
+
+
+def _disk_key(key: Tuple[Hashable, ...]) -> str:
+    """Content-addressed on-disk key: SHA-256 of the JSON-encoded cache key."""
+    return hashlib.sha256(json.dumps(key).encode()).hexdigest()
 
 
 class MCPToolManager:
     """Manages MCP tools for the AI Alert Assistant."""
 
-    def __init__(self, atlassian_client: AtlassianMCPClient):
-        self.atlassian = atlassian_client
-        self.logger = get_logger(__name__)
+    # Seconds a fetched page or space listing is reused from memory, and the
+    # most held before the least recently used is evicted
+    PAGE_CACHE_TTL = 300
+    PAGE_CACHE_MAXSIZE = 512
 
+    # Search results are smaller and repeat less, and go stale sooner as
+    # pages are added
+    SEARCH_CACHE_TTL = 120
+    SEARCH_CACHE_MAXSIZE = 256
+
+    # Seconds a Confluence page is kept in the on-disk cache shared across runs
+    DISK_CACHE_TTL = 86400
+
+    # Search results go stale sooner than page bodies as pages are added
+    DISK_SEARCH_TTL = 3600
+
+    # Default upper bound on concurrent page fetches and searches, kept under
+    # Atlassian's per-user rate limits; override with MCP_MAX_CONCURRENCY
+    BULK_CONCURRENCY = 8
+
+    # Page fetches that fail with a connection error or timeout are retried
+    # with exponential backoff starting from RETRY_BASE_DELAY seconds; each
+    # attempt waits at most FETCH_TIMEOUT seconds for the server, and none
+    # runs past the fetch's deadline
+    FETCH_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.1
+    FETCH_TIMEOUT = 8
+
+    # Share of MCP_CALL_TIMEOUT a page fetch or search may take, queueing for
+    # a fetch slot included, so it gives up before run_async abandons the
+    # whole call and a bulk call still returns the items that finished
+    DEADLINE_SHARE = 0.9
+
+    def __init__(self, atlassian_client: AtlassianMCPClient, use_disk_cache: bool = True):
+        self.atlassian = atlassian_client
+        self._page_cache = TTLCache(ttl=self.PAGE_CACHE_TTL, maxsize=self.PAGE_CACHE_MAXSIZE)
+        self._search_cache = TTLCache(
+            ttl=self.SEARCH_CACHE_TTL, maxsize=self.SEARCH_CACHE_MAXSIZE
+        )
+        self._disk = self._open_disk_cache() if use_disk_cache else None
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._fetch_sem = asyncio.Semaphore(
+            int(os.getenv("MCP_MAX_CONCURRENCY", self.BULK_CONCURRENCY))
+        )
+
+    def _open_disk_cache(self) -> Optional[Cache]:
+        """Open the persistent page cache, or return None if it can't be used."""
+        cache_dir = os.path.join(
+            os.getenv("AI_ALERT_CACHE_DIR", os.path.expanduser("~/.cache/ai-alert-assistant")),
+            "confluence",
+        )
+        try:
+            return Cache(cache_dir)
+        except Exception as e:
+            logger.warning("Disk cache unavailable at %s: %s", cache_dir, e)
+            return None
+
+    def _cache_get(
+        self,
+        cache: TTLCache,
+        key: Tuple[Hashable, ...],
+        disk_key: Optional[Tuple[Hashable, ...]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Look a result up in the given memory cache, then on disk under disk_key or key."""
+        cached = cache.get(key)
+        if cached is None and self._disk is not None:
+            cached = self._disk.get(_disk_key(disk_key or key))
+            if cached is not None:
+                cache.set(key, cached)
+        return cached
+
+    def _cache_set(
+        self,
+        cache: TTLCache,
+        key: Tuple[Hashable, ...],
+        value: Dict[str, Any],
+        disk_ttl: Optional[float] = None,
+        disk_key: Optional[Tuple[Hashable, ...]] = None,
+    ) -> None:
+        """Store a result in the given memory cache, and on disk for disk_ttl seconds if given."""
+        cache.set(key, value)
+        if disk_ttl is not None and self._disk is not None:
+            self._disk.set(_disk_key(disk_key or key), value, expire=disk_ttl)
+
+    def _deadline(self) -> float:
+        """Event loop time by which a page fetch or search started now has to finish."""
+        return asyncio.get_running_loop().time() + _call_timeout() * self.DEADLINE_SHARE
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get hits, misses and size of the in-memory page and search caches."""
+        return {"pages": self._page_cache.stats(), "searches": self._search_cache.stats()}
+
+    def clear_cache(self) -> None:
+        """Drop all cached Confluence results."""
+        self._page_cache.clear()
+        self._search_cache.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    @_coalesce(lambda self: ("resources",))
     async def discover_confluence_resources(self) -> Dict[str, Any]:
         """Discover available Confluence resources with graceful fallback."""
-        try:
-            tools = await self.atlassian.get_confluence_tools()
+        cached = self._page_cache.get(("resources",))
+        if cached is not None:
+            return cached
 
+        try:
             # Get accessible resources
-            resource_tool = next(
-                (
-                    t
-                    for t in tools
-                    if hasattr(t, "name")
-                    and t.name == "confluence_get_space"
-                ),
-                None,
-            )
+            resource_tool = await self.atlassian.get_tool("confluence_get_space")
 
             if resource_tool:
                 try:
                     # Use MCP client to call the tool
-                    server_url = self.atlassian.get_server_url()
-                    async with streamablehttp_client(server_url) as (read, write):
-                        await write.initialize()
-                        result = await write.call_tool(resource_tool.name, {})
-                        self.logger.info("Discovered Confluence resources")
-                        return {
-                            "status": "success",
-                            "resources_available": True,
-                            "data": result.content,
-                        }
+                    result = await self.atlassian.call_tool(resource_tool.name, {})
+                    logger.info("Discovered Confluence resources")
+                    response = {
+                        "status": "success",
+                        "resources_available": True,
+                        "data": _parse_content(result.content),
+                    }
+                    self._page_cache.set(("resources",), response)
+                    return response
                 except Exception as resource_error:
-                    self.logger.warning(f"Resource discovery failed: {resource_error}")
+                    logger.warning("Resource discovery failed: %s", resource_error)
                     return {
                         "status": "partial_success",
                         "resources_available": False,
                         "message": "Resource discovery unavailable",
                     }
             else:
-                self.logger.info("Resource discovery tool not available")
+                logger.info("Resource discovery tool not available")
                 return {
                     "status": "partial_success",
                     "resources_available": False,
@@ -169,7 +495,7 @@ class MCPToolManager:
                 }
 
         except Exception as e:
-            self.logger.warning(f"Failed to discover resources: {e}")
+            logger.warning("Failed to discover resources: %s", e)
             return {
                 "status": "partial_success",
                 "resources_available": False,
@@ -180,45 +506,82 @@ class MCPToolManager:
         self, query: str, space_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """Search Confluence content using MCP with graceful fallback."""
-        try:
-            tools = await self.atlassian.get_confluence_tools()
+        cache_key = ("search", _search_key(query), space_key)
+        return await self._search(query, space_key, cache_key)
 
-            search_tool = next(
-                (t for t in tools if hasattr(t, "name") and t.name == "confluence_search"),
-                None,
-            )
+    async def search_confluence_multi(
+        self, queries: List[str], space_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Search for pages matching any of several queries in one CQL request."""
+        if not queries:
+            return {"status": "error", "message": "No search queries provided"}
 
-            if search_tool:
-                self.logger.info(f"Searching Confluence for: {query}")
-                params = {"query": query}
-                if space_key:
-                    params["space_key"] = space_key
+        # Terms are OR-ed, so their order and case don't change the search
+        cache_key = ("cql", tuple(sorted({q.strip().lower() for q in queries})), space_key)
+        return await self._search(_build_cql(queries, space_key), None, cache_key)
 
-                try:
-                    server_url = self.atlassian.get_server_url()
-                    async with streamablehttp_client(server_url) as (read, write):
-                        await write.initialize()
-                        result = await write.call_tool(search_tool.name, params)
-                        return {"status": "success", "query": query, "results": result.content}
-                except Exception as search_error:
-                    self.logger.warning(f"MCP search failed, using fallback: {search_error}")
+    @_coalesce(lambda self, query, space_key, cache_key: cache_key)
+    async def _search(
+        self, query: str, space_key: Optional[str], cache_key: Tuple[Hashable, ...]
+    ) -> Dict[str, Any]:
+        """Run confluence_search for query, caching successful results under cache_key."""
+        # A wrong entry on disk outlives the process, so the disk entry is also
+        # keyed on the exact query that produced it
+        disk_key = (*cache_key, query)
+        cached = self._cache_get(self._search_cache, cache_key, disk_key)
+        if cached is not None:
+            logger.info("Using cached Confluence search for: %s", query)
+            return cached
+
+        try:
+            async with asyncio.timeout_at(self._deadline()):
+                search_tool = await self.atlassian.get_tool("confluence_search")
+
+                if search_tool:
+                    logger.info("Searching Confluence for: %s", query)
+                    params = {"query": query}
+                    if space_key:
+                        params["space_key"] = space_key
+
+                    try:
+                        async with self._fetch_sem:
+                            result = await self.atlassian.call_tool(search_tool.name, params)
+                        response = {"status": "success", "query": query, "results": _parse_content(result.content)}
+                        self._cache_set(
+                            self._search_cache,
+                            cache_key,
+                            response,
+                            disk_ttl=self.DISK_SEARCH_TTL,
+                            disk_key=disk_key,
+                        )
+                        return response
+                    except Exception as search_error:
+                        logger.warning("MCP search failed, using fallback: %s", search_error)
+                        return {
+                            "status": "partial_success",
+                            "query": query,
+                            "message": "Documentation search unavailable, using general guidance",
+                            "fallback": True
+                        }
+                else:
+                    logger.info("confluence_search tool not available, using fallback")
                     return {
                         "status": "partial_success",
                         "query": query,
-                        "message": "Documentation search unavailable, using general guidance",
+                        "message": "Search tool not available, providing general guidance",
                         "fallback": True
                     }
-            else:
-                self.logger.info("confluence_search tool not available, using fallback")
-                return {
-                    "status": "partial_success",
-                    "query": query,
-                    "message": "Search tool not available, providing general guidance",
-                    "fallback": True
-                }
 
+        except TimeoutError:
+            logger.warning("Search for %s timed out, using fallback", query)
+            return {
+                "status": "partial_success",
+                "query": query,
+                "message": "Documentation search timed out, using general guidance",
+                "fallback": True
+            }
         except Exception as e:
-            self.logger.warning(f"Search failed, using fallback: {e}")
+            logger.warning("Search failed, using fallback: %s", e)
             return {
                 "status": "partial_success",
                 "query": query,
@@ -226,34 +589,102 @@ class MCPToolManager:
                 "fallback": True
             }
 
+    @_coalesce(lambda self, page_id: ("page", page_id))
     async def get_confluence_page(self, page_id: str) -> Dict[str, Any]:
         """Retrieve specific Confluence page content."""
-        try:
-            tools = await self.atlassian.get_confluence_tools()
-
-            page_tool = next(
-                (
-                    t
-                    for t in tools
-                    if hasattr(t, "name") and t.name == "confluence_get_page"
-                ),
-                None,
-            )
+        cached = self._cache_get(self._page_cache, ("page", page_id))
+        if cached is not None:
+            logger.info("Using cached Confluence page: %s", page_id)
+            return cached
 
-            if page_tool:
-                self.logger.info(f"Retrieving Confluence page: {page_id}")
-                server_url = self.atlassian.get_server_url()
-                async with streamablehttp_client(server_url) as (read, write):
-                    await write.initialize()
-                    result = await write.call_tool(page_tool.name, {"page_id": page_id})
-                    return {"status": "success", "page_id": page_id, "content": result.content}
-            else:
-                self.logger.warning("getConfluencePage tool not found")
-                return {
-                    "status": "error",
-                    "message": "Page retrieval tool not available",
-                }
+        deadline = self._deadline()
+        try:
+            async with asyncio.timeout_at(deadline):
+                page_tool = await self.atlassian.get_tool("confluence_get_page")
+
+                if page_tool:
+                    logger.info("Retrieving Confluence page: %s", page_id)
+                    result = await self._fetch_page(page_tool.name, page_id, deadline)
+                    response = {
+                        "status": "success",
+                        "page_id": page_id,
+                        "content": _parse_content(result.content),
+                    }
+                    self._cache_set(
+                        self._page_cache, ("page", page_id), response, disk_ttl=self.DISK_CACHE_TTL
+                    )
+                    return response
+                else:
+                    logger.warning("getConfluencePage tool not found")
+                    return {
+                        "status": "error",
+                        "page_id": page_id,
+                        "message": "Page retrieval tool not available",
+                    }
 
+        except TimeoutError:
+            logger.error("Retrieving Confluence page %s timed out", page_id)
+            return {"status": "error", "page_id": page_id, "message": "Page retrieval timed out"}
         except Exception as e:
-            self.logger.error(f"Page retrieval failed: {e}")
-            return {"status": "error", "message": str(e)}
+            logger.error("Page retrieval failed: %s", e)
+            return {"status": "error", "page_id": page_id, "message": str(e)}
+
+    async def get_confluence_pages(self, page_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieve several Confluence pages concurrently, preserving ID order.
+
+        A page that can't be retrieved, or runs past its deadline, comes back
+        as an error dict carrying its page_id, without discarding the pages
+        that were retrieved.
+        """
+        return list(
+            await asyncio.gather(*(self.get_confluence_page(page_id) for page_id in page_ids))
+        )
+
+    async def fetch_all(self, page_ids: List[str], queries: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve pages and run searches concurrently over the shared session.
+
+        Failed or timed-out pages and searches come back as error or fallback
+        dicts in place, as they do from the single-item methods.
+
+        Returns:
+            Dict with "pages" and "searches" lists, each in argument order
+        """
+        results = await asyncio.gather(
+            *(self.get_confluence_page(page_id) for page_id in page_ids),
+            *(self.search_confluence_content(query) for query in queries),
+        )
+        return {"pages": results[:len(page_ids)], "searches": results[len(page_ids):]}
+
+    async def _fetch_page(self, tool_name: str, page_id: str, deadline: float) -> Any:
+        """
+        Call the page tool, holding a fetch slot and retrying transient failures.
+
+        Only the MCP call itself counts against the concurrency limit, so
+        cache hits are never queued behind slow fetches. Each attempt waits
+        for whatever is left until deadline, up to FETCH_TIMEOUT, and no retry
+        is made once its backoff would reach the deadline.
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.FETCH_ATTEMPTS):
+            try:
+                async with self._fetch_sem:
+                    return await self.atlassian.call_tool(
+                        tool_name,
+                        {"page_id": page_id},
+                        read_timeout=min(self.FETCH_TIMEOUT, deadline - loop.time()),
+                    )
+            except Exception as e:
+                delay = self.RETRY_BASE_DELAY * 2 ** attempt * random.uniform(0.5, 1.5)
+                if (
+                    attempt == self.FETCH_ATTEMPTS - 1
+                    or not _is_transient(e)
+                    or loop.time() + delay >= deadline
+                ):
+                    raise
+                logger.warning(
+                    "Fetching Confluence page %s failed (%s), retrying in %.2fs",
+                    page_id, e, delay,
+                )
+                await asyncio.sleep(delay)
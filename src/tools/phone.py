@@ -2,6 +2,8 @@
 Phone tool manager with mock implementation.
 """
 
+import sys
+
 from strands.tools import tool
 from utilities.logger import get_logger
 
@@ -16,14 +18,22 @@ class PhoneToolManager:
 
     @tool
     def call_customer(self, phone_number: str, message: str) -> str:
-        print("=" * 60)
-        print("CALLING CUSTOMER")
-        print("=" * 60)
-        print(f"Calling: {phone_number}")
-        print(f"Message: {message}")
-        print("=" * 60)
-        print("Call completed successfully (mock)")
-        print()
-
-        logger.info(f"Mock call made to {phone_number}")
+        # Write the whole mock call at once rather than line by line
+        rule = "=" * 60
+        sys.stdout.write(
+            "\n".join(
+                (
+                    rule,
+                    "CALLING CUSTOMER",
+                    rule,
+                    f"Calling: {phone_number}",
+                    f"Message: {message}",
+                    rule,
+                    "Call completed successfully (mock)",
+                )
+            )
+            + "\n\n"
+        )
+
+        logger.info("Mock call made to %s", phone_number)
         return f"Call completed successfully to {phone_number}"
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+Environment loading shared by the entry point and modules that read settings.
+"""
+
+import threading
+
+from dotenv import load_dotenv
+
+_LOCK = threading.Lock()
+_LOADED = False
+
+
+def load_env() -> None:
+    """
+    Load variables from .env into the environment, at most once per process.
+
+    Later calls return immediately, so any module that needs settings can
+    call this without the file being parsed again.
+    """
+    global _LOADED
+    if _LOADED:
+        return
+
+    with _LOCK:
+        if not _LOADED:
+            load_dotenv()
+            _LOADED = True
+
+
+__all__ = ["load_env"]
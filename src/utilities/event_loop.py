@@ -0,0 +1,107 @@
+"""
+Shared background event loop that owns MCP state, reached from other event loops.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create a new event loop, using uvloop when it is installed.
+
+    Returns:
+        asyncio.AbstractEventLoop: New event loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared background event loop, starting it on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: Loop running forever on a daemon thread
+    """
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="mcp-event-loop", daemon=True
+                ).start()
+                _loop = loop
+                logger.debug("Background event loop started")
+    return _loop
+
+
+def _stop_event_loop() -> None:
+    """Stop the shared event loop at interpreter exit."""
+    if _loop is not None and _loop.is_running():
+        _loop.call_soon_threadsafe(_loop.stop)
+
+
+# Registered at import so it runs after exit hooks registered later that still
+# need the loop, such as closing the MCP session (atexit runs hooks in reverse)
+atexit.register(_stop_event_loop)
+
+
+def _call_timeout() -> float:
+    """Seconds to wait for a coroutine on the shared loop (MCP_CALL_TIMEOUT)."""
+    return float(os.getenv("MCP_CALL_TIMEOUT", "30"))
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+    """
+    Schedule a coroutine on the shared event loop without waiting for it.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        concurrent.futures.Future: Future for the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+async def run_async(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    Await a coroutine on the shared event loop from another running loop.
+
+    Strands runs each agent invocation on its own event loop; async tools use
+    this to reach MCP state owned by the shared loop without blocking.
+
+    Args:
+        coro: Coroutine to execute
+        timeout: Seconds to wait before cancelling, defaults to MCP_CALL_TIMEOUT
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        TimeoutError: If the coroutine doesn't finish in time
+    """
+    return await asyncio.wait_for(
+        asyncio.wrap_future(submit(coro)), timeout or _call_timeout()
+    )
+
+
+__all__ = ["get_event_loop", "new_event_loop", "run_async", "submit"]
@@ -5,7 +5,8 @@ Logging configuration for AI DBA Assistant.
 import logging
 import os
 import sys
-from typing import Optional
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
 
 from termcolor import colored
 
@@ -21,16 +22,25 @@ class ColoredFormatter(logging.Formatter):
         "CRITICAL": "magenta",
     }
 
-    def format(self, record):
-        """Format the log record with colors."""
-        log_message = super().format(record)
+    # Levels are a fixed set, so their colored prefixes are rendered once
+    _LEVEL_PREFIX = {
+        level: colored(f"[{level}]", color, attrs=["bold"]) for level, color in COLORS.items()
+    }
 
-        # Add color based on log level
-        color = self.COLORS.get(record.levelname, "white")
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._name_cache: Dict[str, str] = {}
 
+    def format(self, record):
+        """Format the log record with colors."""
         # Format: [LEVEL] module_name: message
-        colored_level = colored(f"[{record.levelname}]", color, attrs=["bold"])
-        colored_name = colored(record.name, "blue")
+        colored_level = self._LEVEL_PREFIX.get(record.levelname)
+        if colored_level is None:
+            colored_level = colored(f"[{record.levelname}]", "white", attrs=["bold"])
+
+        colored_name = self._name_cache.get(record.name)
+        if colored_name is None:
+            colored_name = self._name_cache[record.name] = colored(record.name, "blue")
 
         return f"{colored_level} {colored_name}: {record.getMessage()}"
 
@@ -39,6 +49,9 @@ def setup_logging(level: str = None) -> None:
     """
     Set up logging configuration for the application.
 
+    Importing the package never configures logging; the CLI calls this once
+    at startup, and embedding applications configure logging themselves.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
@@ -48,6 +61,13 @@ def setup_logging(level: str = None) -> None:
     # Convert string level to logging constant
     numeric_level = getattr(logging, log_level, logging.WARNING)
 
+    # Records never use thread, process or multiprocessing names, so skip
+    # collecting them for every log call; these are process-wide, which is
+    # why they are only set here, where the application owns logging
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
@@ -60,8 +80,10 @@ def setup_logging(level: str = None) -> None:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
 
-    # Set formatter
-    formatter = ColoredFormatter(
+    # Set formatter; color only when writing to a terminal, and keep the
+    # timestamped plain format for piped or redirected output
+    formatter_class = ColoredFormatter if sys.stdout.isatty() else logging.Formatter
+    formatter = formatter_class(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -93,12 +115,43 @@ def styled_log(header: str, message: str, color: str = "white") -> None:
         message: Message content
         color: Color for the header
     """
-    logger = get_logger("ai_dba.styled")
+    # Skip ANSI styling when output is piped or redirected
+    if not sys.stdout.isatty():
+        print(f"{header}:\n{message}")
+        return
+
     colored_header = colored(f"{header}:", color, attrs=["bold"])
     colored_message = colored(message, color)
     print(f"{colored_header}\n{colored_message}")
 
 
+@contextmanager
+def styled_stream(header: str, color: str = "white") -> Iterator[Callable[[str], None]]:
+    """
+    Print a colored header and yield a writer for a message that arrives in chunks.
+
+    The message is ended with a newline when the block exits.
+
+    Args:
+        header: Header text (will be colored and bolded)
+        color: Color for the header and message
+
+    Yields:
+        Callable[[str], None]: Writes and flushes one chunk of the message
+    """
+    styled = sys.stdout.isatty()
+    print(colored(f"{header}:", color, attrs=["bold"]) if styled else f"{header}:")
+
+    def write(chunk: str) -> None:
+        sys.stdout.write(colored(chunk, color) if styled else chunk)
+        sys.stdout.flush()
+
+    try:
+        yield write
+    finally:
+        print()
+
+
 def log_tool_call(tool_name: str, message: str) -> None:
     """
     Log a tool call with consistent formatting.
@@ -140,14 +193,12 @@ def log_warning(message: str) -> None:
     styled_log("WARNING", message, "yellow")
 
 
-# Initialize logging on module import
-setup_logging()
-
 # Export commonly used functions
 __all__ = [
     "setup_logging",
     "get_logger",
     "styled_log",
+    "styled_stream",
     "log_tool_call",
     "log_error",
     "log_success",
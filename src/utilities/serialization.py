@@ -0,0 +1,65 @@
+"""
+JSON encoding for tool results handed back to the model.
+"""
+
+import functools
+import inspect
+from collections.abc import Mapping
+from typing import Any, Callable
+
+import orjson
+
+
+def _default(obj: Any) -> Any:
+    """Encode values orjson doesn't handle natively."""
+    # MCP content blocks and other pydantic models
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(exclude_none=True)
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def encode_result(result: Any) -> str:
+    """
+    Encode a tool result as a JSON string.
+
+    Args:
+        result: Tool return value
+
+    Returns:
+        str: JSON text for the model
+    """
+    return orjson.dumps(result, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def json_result(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Make a tool function return its result encoded by encode_result.
+
+    Strands hands non-string results to the model as their Python repr, and
+    treats any dict with both "status" and "content" keys as a raw tool
+    result; returning JSON text avoids both.
+
+    Args:
+        func: Sync or async tool function returning a JSON-serializable value
+
+    Returns:
+        The wrapped function, with the original signature for schema generation
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> str:
+            return encode_result(await func(*args, **kwargs))
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        return encode_result(func(*args, **kwargs))
+
+    return wrapper
+
+
+__all__ = ["encode_result", "json_result"]
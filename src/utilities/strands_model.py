@@ -3,65 +3,117 @@ Strands model configuration and management.
 """
 
 import os
-from typing import Union
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Union
 
-from dotenv import load_dotenv
+from strands import Agent
 from strands.models.ollama import OllamaModel
 from strands.models.openai import OpenAIModel
 
+from .env import load_env
 from .logger import get_logger
 
 # Load environment variables
-load_dotenv()
+load_env()
 
 logger = get_logger(__name__)
 
 
+class ModelType(IntEnum):
+    """Supported model providers."""
+
+    OPENAI = 0
+    OLLAMA = 1
+
+
+# MODEL_TYPE values and the provider each selects
+_MODEL_TYPES = {"openai": ModelType.OPENAI, "ollama": ModelType.OLLAMA}
+
+
 class ModelConfig:
     """Configuration class for AI models."""
 
+    __slots__ = (
+        "model_type",
+        "kind",
+        "openai_api_key",
+        "openai_model",
+        "ollama_model",
+        "ollama_host",
+        "_validated",
+    )
+
     def __init__(self):
-        self.model_type = os.getenv("MODEL_TYPE", "openai").lower()
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.openai_model = os.getenv("OPENAI_MODEL", "gpt-4")
-        self.ollama_model = os.getenv("OLLAMA_MODEL", "llama2")
-        self.ollama_host = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+        env = os.environ
+        self.model_type = env.get("MODEL_TYPE", "openai").lower()
+        # Resolved once; None for an unsupported MODEL_TYPE
+        self.kind: Optional[ModelType] = _MODEL_TYPES.get(self.model_type)
+        self.openai_api_key = env.get("OPENAI_API_KEY")
+        self.openai_model = env.get("OPENAI_MODEL", "gpt-4")
+        self.ollama_model = env.get("OLLAMA_MODEL", "llama2")
+        self.ollama_host = env.get("OLLAMA_BASE_URL", "http://localhost:11434")
+        self._validated = False
+
+    @staticmethod
+    def reset_cache() -> None:
+        """Forget the cached configuration so the environment is read again."""
+        _get_config.cache_clear()
+        get_model_info.cache_clear()
+        get_model.cache_clear()
 
     def validate(self) -> None:
         """Validate the model configuration."""
-        if self.model_type == "openai" and not self.openai_api_key:
+        # Settings don't change after construction, so one success is enough
+        if self._validated:
+            return
+
+        if self.kind is ModelType.OPENAI and not self.openai_api_key:
             raise ValueError(
                 "OPENAI_API_KEY environment variable is required for OpenAI models. "
                 "Please set it in your .env file or environment."
             )
 
-        if self.model_type not in ["openai", "ollama"]:
+        if self.kind is None:
             raise ValueError(
                 f"Unsupported model type: {self.model_type}. "
                 "Supported types: openai, ollama"
             )
 
+        self._validated = True
+
+
+@lru_cache(maxsize=1)
+def _get_config() -> ModelConfig:
+    """Get the model configuration, read from the environment once per process."""
+    return ModelConfig()
+
 
-def create_model() -> Union[OpenAIModel, OllamaModel]:
+def create_model(config: Optional[ModelConfig] = None) -> Union[OpenAIModel, OllamaModel]:
     """
     Create and return the appropriate AI model based on configuration.
 
+    Args:
+        config: Configuration to use; defaults to the process-wide cached one
+
     Returns:
         Union[OpenAIModel, OllamaModel]: Configured model instance
 
     Raises:
         ValueError: If configuration is invalid or required keys are missing
     """
-    config = ModelConfig()
+    if config is None:
+        config = _get_config()
     config.validate()
 
-    if config.model_type == "openai":
-        logger.info(f"Creating OpenAI model: {config.openai_model}")
+    if config.kind is ModelType.OPENAI:
+        logger.info("Creating OpenAI model: %s", config.openai_model)
         return OpenAIModel(model_id=config.openai_model, api_key=config.openai_api_key)
 
-    elif config.model_type == "ollama":
+    elif config.kind is ModelType.OLLAMA:
         logger.info(
-            f"Creating Ollama model: {config.ollama_model} at {config.ollama_host}"
+            "Creating Ollama model: %s at %s", config.ollama_model, config.ollama_host
         )
         return OllamaModel(model=config.ollama_model, host=config.ollama_host)
 
@@ -70,18 +122,22 @@ def create_model() -> Union[OpenAIModel, OllamaModel]:
         raise ValueError(f"Unsupported model type: {config.model_type}")
 
 
-def get_model_info() -> dict:
+@lru_cache(maxsize=1)
+def get_model_info() -> Mapping[str, Any]:
     """
     Get information about the current model configuration.
 
+    The configuration is read once per process, and every caller shares the
+    same read-only mapping.
+
     Returns:
-        dict: Model configuration information
+        Mapping[str, Any]: Model configuration information
     """
-    config = ModelConfig()
+    config = _get_config()
 
     info = {"model_type": config.model_type, "configured": True}
 
-    if config.model_type == "openai":
+    if config.kind is ModelType.OPENAI:
         info.update(
             {
                 "model_name": config.openai_model,
@@ -89,7 +145,7 @@ def get_model_info() -> dict:
                 "provider": "OpenAI",
             }
         )
-    elif config.model_type == "ollama":
+    elif config.kind is ModelType.OLLAMA:
         info.update(
             {
                 "model_name": config.ollama_model,
@@ -98,18 +154,72 @@ def get_model_info() -> dict:
             }
         )
 
-    return info
+    return MappingProxyType(info)
+
+
+async def run_agent(
+    agent: Agent, prompt: str, on_chunk: Optional[Callable[[str], None]] = None
+) -> str:
+    """
+    Run an agent on the caller's event loop and return its final response text.
 
+    Uses the agent's async stream instead of the blocking call, which would
+    stall the running loop until the whole completion is available.
 
-# Create the default model instance
-try:
-    model = create_model()
-    logger.info("Model created successfully")
-except Exception as e:
-    logger.error(f"Failed to create model: {e}")
-    # Don't raise here to allow for graceful degradation
-    model = None
+    Args:
+        agent: Strands agent to invoke
+        prompt: Prompt to send
+        on_chunk: Called with each chunk of generated text as it arrives
 
+    Returns:
+        str: Final response text
+    """
+    result = None
+    # Drain the stream rather than returning on the result event so the
+    # agent finishes its own cleanup
+    async for event in agent.stream_async(prompt):
+        if on_chunk is not None and "data" in event:
+            on_chunk(event["data"])
+        if "result" in event:
+            result = event["result"]
+
+    if result is None:
+        raise RuntimeError("Agent stream ended without a result")
+    return str(result)
+
+
+@lru_cache(maxsize=1)
+def get_model() -> Optional[Union[OpenAIModel, OllamaModel]]:
+    """
+    Get the default model instance, creating it on first use.
 
-# Export the model instance and factory functions
-__all__ = ["model", "create_model", "get_model_info", "ModelConfig"]
+    Returns:
+        The configured model, or None if it couldn't be created
+    """
+    try:
+        model = create_model(_get_config())
+        logger.info("Model created successfully")
+        return model
+    except Exception as e:
+        logger.error("Failed to create model: %s", e)
+        # Don't raise here to allow for graceful degradation
+        return None
+
+
+def __getattr__(name: str):
+    # Keep `from utilities.strands_model import model` working without
+    # building the model client at import time
+    if name == "model":
+        return get_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Export the model accessor and factory functions
+__all__ = [
+    "get_model",
+    "create_model",
+    "get_model_info",
+    "run_agent",
+    "ModelConfig",
+    "ModelType",
+]
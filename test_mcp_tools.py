@@ -1,31 +1,111 @@
 #!/usr/bin/env python3
 """
 Test script to list all available MCP tools from mcp-atlassian server.
+
+Tool names and descriptions are cached for a day; pass --tool NAME to fetch
+one tool's full input schema, or --refresh to rebuild the cached index.
 """
 
+import argparse
 import asyncio
+import json
 import os
 import sys
-sys.path.insert(0, 'src')
+import time
 
-from mcp import StdioServerParameters
+from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from dotenv import load_dotenv
 
-async def list_mcp_tools():
+# Seconds the cached tool index is used before the server is asked again
+INDEX_MAX_AGE = 24 * 60 * 60
+
+DESCRIPTION_PREFIX = "    Description: "
+INPUT_SCHEMA_PREFIX = "    Input Schema: "
+
+
+def index_path():
+    cache_dir = os.getenv("AI_ALERT_CACHE_DIR", os.path.expanduser("~/.cache/ai-alert-assistant"))
+    return os.path.join(cache_dir, "mcp_tools.json")
+
+
+def load_index():
+    """Return the cached tool index, or None if it's missing or stale."""
+    path = index_path()
+    try:
+        if time.time() - os.path.getmtime(path) < INDEX_MAX_AGE:
+            with open(path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def save_index(tools):
+    """Cache tool names and one-line descriptions, without input schemas."""
+    index = [
+        {"name": tool.name, "description": (tool.description or "").split("\n", 1)[0]}
+        for tool in tools
+    ]
+    path = index_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(index, f)
+    except OSError as e:
+        print(f'⚠️  Could not cache tool index: {e}')
+    return index
+
+
+def print_index(index):
+    # Build the whole listing and write it at once rather than line by line
+    lines = [f'\n✅ Successfully found {len(index)} tools:\n']
+    for i, tool in enumerate(index, 1):
+        lines.append(f'{i:2d}. {tool["name"]}\n{DESCRIPTION_PREFIX}{tool["description"]}\n')
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _mask_token(token):
+    """Mask all but the last 10 characters of an API token."""
+    return f'{"*" * max(0, len(token) - 10)}{token[-10:]}'
+
+
+async def fetch_tools(server_params):
+    print("Connecting to MCP server...")
+    async with stdio_client(server_params) as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            # Initialize the client
+            print("Initializing MCP client...")
+            await session.initialize()
+
+            # List available tools
+            print("Requesting tools list...")
+            tools_response = await session.list_tools()
+            return tools_response.tools
+
+
+async def list_mcp_tools(tool_name=None, refresh=False):
     # Load environment variables
     load_dotenv()
-    
+
     confluence_url = os.getenv('CONFLUENCE_URL')
     username = os.getenv('CONFLUENCE_USERNAME')
     api_token = os.getenv('CONFLUENCE_API_TOKEN')
-    
+
     print("=== MCP Atlassian Tool Discovery ===")
     print(f'Confluence URL: {confluence_url}')
     print(f'Username: {username}')
-    print(f'API Token: {"*" * (len(api_token) - 10) + api_token[-10:] if api_token else "Not set"}')
+    print(f'API Token: {_mask_token(api_token) if api_token else "Not set"}')
     print()
-    
+
+    # Names and descriptions don't need the server; serve them from cache
+    if tool_name is None and not refresh:
+        index = load_index()
+        if index is not None:
+            print(f'Using cached tool index from {index_path()} (--refresh to update)')
+            print_index(index)
+            return
+
     # Create MCP server parameters
     server_params = StdioServerParameters(
         command='mcp-atlassian',
@@ -35,32 +115,39 @@ async def list_mcp_tools():
             'CONFLUENCE_API_TOKEN': api_token,
         }
     )
-    
+
     try:
-        print("Connecting to MCP server...")
-        async with stdio_client(server_params) as streams:
-            read_stream, write_stream = streams
-            # Initialize the client
-            print("Initializing MCP client...")
-            await write_stream.initialize()
-            
-            # List available tools
-            print("Requesting tools list...")
-            tools_response = await write_stream.list_tools()
-            
-            print(f'\n✅ Successfully found {len(tools_response.tools)} tools:\n')
-            
-            for i, tool in enumerate(tools_response.tools, 1):
-                print(f'{i:2d}. {tool.name}')
-                print(f'    Description: {tool.description}')
-                if hasattr(tool, 'inputSchema') and tool.inputSchema:
-                    print(f'    Input Schema: {tool.inputSchema}')
-                print()
-                
+        tools = await fetch_tools(server_params)
+        index = save_index(tools)
+
+        if tool_name is None:
+            print_index(index)
+            return
+
+        tool = next((tool for tool in tools if tool.name == tool_name), None)
+        if tool is None:
+            print(f'❌ Tool not found: {tool_name}')
+            return
+
+        lines = [f'\n{tool.name}', f'{DESCRIPTION_PREFIX}{tool.description}']
+        input_schema = getattr(tool, 'inputSchema', None)
+        if input_schema:
+            lines.append(f'{INPUT_SCHEMA_PREFIX}{input_schema}')
+        sys.stdout.write("\n".join(lines) + "\n")
+
     except Exception as e:
         print(f'❌ Error listing tools: {e}')
         import traceback
         traceback.print_exc()
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="List tools offered by the mcp-atlassian server")
+    parser.add_argument("--tool", metavar="NAME", help="Show the full input schema for one tool")
+    parser.add_argument("--refresh", action="store_true", help="Ignore the cached tool index")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    asyncio.run(list_mcp_tools())
\ No newline at end of file
+    args = parse_args()
+    asyncio.run(list_mcp_tools(tool_name=args.tool, refresh=args.refresh))